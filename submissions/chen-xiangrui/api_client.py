@@ -6,23 +6,310 @@ Includes retry logic, timeout handling, and structured error handling.
 """
 
 import asyncio
+import base64
+import hashlib
 import logging
-from typing import Any, Optional
+import os
+import random
+import tempfile
+import time
+from urllib.parse import quote
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Iterator, Mapping, Optional, Union
 
 import aiohttp
+import ijson
+import orjson
+from yarl import URL
 
 from config import Config
 from models import AuthToken
 
 logger = logging.getLogger(__name__)
 
+# On-disk JWT cache shared between CLI invocations
+TOKEN_CACHE_PATH = Path.home() / ".banking_client_jwt_cache"
+
+# Refresh cached tokens this many seconds before they actually expire
+TOKEN_EXPIRY_BUFFER = 60
+
+# Seconds an account validation result is reused before asking the server again
+VALIDATION_CACHE_TTL = 60.0
+
+# Bytes of an error response body kept on BankingAPIError
+ERROR_BODY_LIMIT = 200
+
+# Failures that are retried with backoff before giving up
+TRANSIENT_ERRORS = (asyncio.TimeoutError, aiohttp.ClientConnectionError)
+
+# Process-wide HTTP session shared by all clients so connections are reused
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_SHARED_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SHARED_SESSION_REFS = 0
+
+
+async def _get_or_create_shared_session(config: Config) -> aiohttp.ClientSession:
+    """
+    Acquire a reference to the shared aiohttp session, creating it on first use.
+
+    The connection pool is sized from the config of the client that creates
+    the session.
+
+    No lock is needed: there is no await between the check and the assignment,
+    so concurrent callers on the same event loop cannot race.
+
+    Args:
+        config: Configuration of the client acquiring the session
+
+    Returns:
+        aiohttp.ClientSession: Session bound to the running event loop
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP, _SHARED_SESSION_REFS
+
+    loop = asyncio.get_running_loop()
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed or _SHARED_SESSION_LOOP is not loop:
+        logger.debug("Creating shared HTTP session")
+        connector = aiohttp.TCPConnector(
+            limit=config.pool_size,
+            limit_per_host=config.pool_size_per_host,
+            keepalive_timeout=config.keepalive_timeout,
+            enable_cleanup_closed=True,
+        )
+        _SHARED_SESSION = aiohttp.ClientSession(
+            connector=connector,
+            json_serialize=_json_dumps,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        )
+        _SHARED_SESSION_LOOP = loop
+        _SHARED_SESSION_REFS = 0
+
+    _SHARED_SESSION_REFS += 1
+    return _SHARED_SESSION
+
+
+async def _release_shared_session(session: aiohttp.ClientSession):
+    """
+    Release a reference to the shared session, closing it with the last one.
+
+    Args:
+        session: Session previously returned by _get_or_create_shared_session()
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP, _SHARED_SESSION_REFS
+
+    # Sessions left over from another event loop are not ours to close
+    if session is not _SHARED_SESSION:
+        return
+
+    _SHARED_SESSION_REFS -= 1
+    if _SHARED_SESSION_REFS <= 0:
+        _SHARED_SESSION = None
+        _SHARED_SESSION_LOOP = None
+        _SHARED_SESSION_REFS = 0
+        logger.debug("Closing shared HTTP session")
+        await session.close()
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson."""
+    return orjson.dumps(obj).decode()
+
+
+def _backoff_delay(retry_count: int, base: float, cap: float) -> float:
+    """
+    Compute a retry delay using exponential backoff with full jitter.
+
+    Args:
+        retry_count: Number of attempts made so far, starting at 0
+        base: Delay of the first retry before jitter, in seconds
+        cap: Upper bound on the delay, in seconds
+
+    Returns:
+        float: Seconds to wait, uniformly drawn from [0, min(cap, base * 2**retry_count)]
+    """
+    return random.uniform(0, min(cap, base * 2**retry_count))
+
+
+def _token_cache_key(base_url: str, username: str, password: str, claim: str) -> str:
+    """Build the cache key for a server and credentials without storing them in clear."""
+    return hashlib.sha256(f"{base_url}|{username}|{password}|{claim}".encode()).hexdigest()
+
+
+def _account_url(base_url: URL, account_number: str) -> URL:
+    """
+    Append an account number to a URL as a single, fully percent-encoded path segment.
+
+    Slashes are encoded and a bare "." or ".." is escaped, so the account
+    number cannot add path segments or walk up to another endpoint.
+
+    Args:
+        base_url: URL of the account endpoint
+        account_number: Account number, as given by the caller
+
+    Returns:
+        URL: Endpoint URL for the account
+    """
+    segment = quote(account_number, safe="")
+    if segment in (".", ".."):
+        segment = segment.replace(".", "%2E")
+    return base_url.joinpath(segment, encoded=True)
+
+
+def _decode_jwt_segment(segment: str) -> Optional[dict]:
+    """Decode a base64url JWT header or payload segment into a JSON object."""
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _decode_jwt_exp(token: str) -> Optional[float]:
+    """
+    Read the ``exp`` claim from a JWT payload.
+
+    The signature is not verified; this is only used to decide whether a token
+    we received from the server is still worth reusing.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        float: Expiry as a Unix timestamp, or None if the token carries no expiry
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+
+    payload = _decode_jwt_segment(parts[1])
+    exp = payload.get("exp") if payload else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def _build_auth_token(token: str) -> AuthToken:
+    """Wrap a raw JWT in an AuthToken, carrying over its expiry if present."""
+    exp = _decode_jwt_exp(token)
+    expires_at = datetime.fromtimestamp(exp) if exp is not None else None
+    return AuthToken(token=token, expires_at=expires_at)
+
+
+def _auth_headers(auth_token: AuthToken) -> Mapping[str, str]:
+    """Build the read-only request headers carrying a token."""
+    return MappingProxyType({"Authorization": auth_token.get_header_value()})
+
+
+def _is_token_fresh(auth_token: AuthToken) -> bool:
+    """Check whether a token is valid for at least TOKEN_EXPIRY_BUFFER more seconds."""
+    expires_epoch = auth_token.expires_epoch
+    if expires_epoch is None:
+        return False
+    return expires_epoch - time.time() >= TOKEN_EXPIRY_BUFFER
+
+
+def _read_token_cache() -> dict:
+    """Load the on-disk token cache, returning an empty cache on any error."""
+    try:
+        with open(TOKEN_CACHE_PATH, "rb") as f:
+            data = orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable token cache {TOKEN_CACHE_PATH}: {e}")
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def _write_token_cache(entries: dict):
+    """
+    Atomically persist the token cache with owner-only permissions.
+
+    Args:
+        entries: Mapping of cache key to JWT token string
+    """
+    cache_dir = TOKEN_CACHE_PATH.parent
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{TOKEN_CACHE_PATH.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(f.fileno(), 0o600)
+                f.write(orjson.dumps(entries))
+            os.replace(tmp_path, TOKEN_CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write token cache {TOKEN_CACHE_PATH}: {e}")
+
+
+def _save_cached_token(cache_key: str, token: str):
+    """
+    Add a token to the on-disk cache, pruning entries that have expired.
+
+    Args:
+        cache_key: Key produced by _token_cache_key()
+        token: JWT token string
+    """
+    entries = {
+        key: value
+        for key, value in _read_token_cache().items()
+        if isinstance(value, str) and _is_token_fresh(_build_auth_token(value))
+    }
+    entries[cache_key] = token
+    _write_token_cache(entries)
+
+
+def _remove_cached_token(token: str):
+    """
+    Drop every on-disk cache entry holding the given token.
+
+    Args:
+        token: JWT token string
+    """
+    entries = _read_token_cache()
+    remaining = {key: value for key, value in entries.items() if value != token}
+    if len(remaining) != len(entries):
+        _write_token_cache(remaining)
+
 
 class BankingAPIError(Exception):
-    """Base exception for banking API errors."""
+    """
+    Base exception for banking API errors.
+
+    Errors raised for HTTP error statuses keep the status code and the start
+    of the response body, and only format their message when it is read.
+    Callers that catch and discard the error never pay for the string.
+    """
 
-    def __init__(self, message: str, status_code: Optional[int] = None):
-        super().__init__(message)
+    def __init__(
+        self,
+        message: Optional[str] = None,
+        status_code: Optional[int] = None,
+        body: bytes = b"",
+    ):
+        body = body[:ERROR_BODY_LIMIT]
+        super().__init__(message, status_code, body)
         self.status_code = status_code
+        self.body = body
+        self._message = message
+
+    @property
+    def message(self) -> str:
+        """str: Error message, built from the status code and body if not given."""
+        if self._message is None:
+            body = self.body.decode("utf-8", errors="replace")
+            self._message = f"API error (status {self.status_code}): {body}"
+        return self._message
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self):
+        return type(self), (self._message, self.status_code, self.body)
 
 
 class BankingAPIClient:
@@ -30,13 +317,16 @@ class BankingAPIClient:
     Modern HTTP client for Core Banking API.
 
     Features:
-    - Async/await with aiohttp
+    - Async/await with aiohttp over a shared, pooled session
     - Automatic retry on transient failures
     - Proper timeout handling
     - Structured error handling
-    - JWT token management
+    - JWT token management with expiry-aware caching
     """
 
+    # JWT tokens minted by the server, keyed by _token_cache_key()
+    _token_cache: dict[str, AuthToken] = {}
+
     def __init__(self, config: Config):
         """
         Initialize the API client.
@@ -46,23 +336,70 @@ class BankingAPIClient:
         """
         self.config = config
         self.session: Optional[aiohttp.ClientSession] = None
+        self._closed = False
         self.auth_token: Optional[AuthToken] = None
+        self._timeout = aiohttp.ClientTimeout(total=config.timeout)
+
+        # Parsed once so aiohttp can use them without re-parsing per request
+        self._base_url = URL(config.base_url)
+        self._urls: dict[str, URL] = {}
+        self._account_validate_url = self._base_url / "accounts" / "validate"
+        self._account_balance_url = self._base_url / "accounts" / "balance"
+
+        # Authorization header prebuilt by set_auth_token(), sent until it expires
+        self._auth_headers: Optional[Mapping[str, str]] = None
+        self._auth_headers_expiry = 0.0
+
+        # Account number -> (is_valid, monotonic expiry) for recent validations
+        self._validation_cache: dict[str, tuple[bool, float]] = {}
+
+    async def connect(self) -> "BankingAPIClient":
+        """
+        Acquire the shared session, if this client does not hold it already.
+
+        Requests call this on demand, so a client can be used without the
+        async context manager as long as close() is awaited when done.
+        Calling it explicitly also reopens a closed client.
+
+        Returns:
+            BankingAPIClient: This client
+        """
+        self._closed = False
+        if self.session is None:
+            self.session = await _get_or_create_shared_session(self.config)
+        return self
+
+    async def close(self):
+        """Release the shared session held by this client, if any."""
+        self._closed = True
+        if self.session:
+            session, self.session = self.session, None
+            await _release_shared_session(session)
+
+    async def _require_session(self) -> aiohttp.ClientSession:
+        """
+        Return the session for a request, connecting on first use.
+
+        Returns:
+            aiohttp.ClientSession: Session held by this client
+
+        Raises:
+            RuntimeError: If the client has been closed
+        """
+        session = self.session
+        if session is None:
+            if self._closed:
+                raise RuntimeError("Client session is closed. Use async context manager.")
+            session = self.session = await _get_or_create_shared_session(self.config)
+        return session
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-            headers={
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-        )
-        return self
+        return await self.connect()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.close()
 
     def set_auth_token(self, token: str):
         """
@@ -71,107 +408,365 @@ class BankingAPIClient:
         Args:
             token: JWT token string
         """
-        self.auth_token = AuthToken(token=token)
+        self.auth_token = _build_auth_token(token)
+        self._auth_headers = _auth_headers(self.auth_token)
+        expires_epoch = self.auth_token.expires_epoch
+        self._auth_headers_expiry = float("inf") if expires_epoch is None else expires_epoch
         logger.debug("Authentication token set")
 
-    async def _make_request(
+    async def _get_cached_token(self, cache_key: str) -> Optional[AuthToken]:
+        """
+        Look up a still-fresh token in memory, then on disk.
+
+        Disk access runs in a worker thread so it does not block the event loop.
+
+        Args:
+            cache_key: Key produced by _token_cache_key()
+
+        Returns:
+            AuthToken: Cached token, or None if no fresh token is available
+        """
+        auth_token = self._token_cache.get(cache_key)
+        if auth_token and _is_token_fresh(auth_token):
+            return auth_token
+
+        token = (await asyncio.to_thread(_read_token_cache)).get(cache_key)
+        if isinstance(token, str):
+            auth_token = _build_auth_token(token)
+            if _is_token_fresh(auth_token):
+                self._token_cache[cache_key] = auth_token
+                return auth_token
+
+        return None
+
+    async def _store_token(self, cache_key: str, token: str):
+        """
+        Remember a freshly minted token in memory and on disk.
+
+        Tokens without an ``exp`` claim are not cached since we cannot tell
+        when they stop being valid.
+
+        Args:
+            cache_key: Key produced by _token_cache_key()
+            token: JWT token string
+        """
+        auth_token = _build_auth_token(token)
+        if auth_token.expires_at is None:
+            return
+
+        self._token_cache[cache_key] = auth_token
+        await asyncio.to_thread(_save_cached_token, cache_key, token)
+
+    async def _discard_auth_token(self):
+        """
+        Forget the current token after the server rejected it.
+
+        The token is dropped from the request headers and from the memory and
+        disk caches, so the next get_auth_token() call mints a new one.
+        """
+        if self.auth_token is None:
+            return
+
+        token = self.auth_token.token
+        logger.warning("Authentication token rejected by server; discarding cached token")
+
+        self.auth_token = None
+        self._auth_headers = None
+        self._auth_headers_expiry = 0.0
+
+        for key, auth_token in list(self._token_cache.items()):
+            if auth_token.token == token:
+                del self._token_cache[key]
+
+        await asyncio.to_thread(_remove_cached_token, token)
+
+    def _url(self, endpoint: str) -> URL:
+        """
+        Resolve a static endpoint path against the base URL, caching the result.
+
+        Args:
+            endpoint: API endpoint path (e.g. "/transfer")
+
+        Returns:
+            URL: Absolute URL of the endpoint
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self._base_url / endpoint.lstrip("/")
+        return url
+
+    def _connection_error(self, error: Exception, method: str, url: URL) -> ConnectionError:
+        """
+        Log a transient request failure and build the error raised if it is final.
+
+        Args:
+            error: Timeout or connection error raised by aiohttp
+            method: HTTP method of the failed request
+            url: URL of the failed request
+
+        Returns:
+            ConnectionError: Error describing the failure
+        """
+        if isinstance(error, asyncio.TimeoutError):
+            error_msg = f"Request timeout after {self.config.timeout}s: {method} {url}"
+            logger.error(error_msg)
+            return ConnectionError(error_msg)
+
+        error_msg = f"Connection failed: {error}"
+        logger.error(error_msg)
+        return ConnectionError(
+            f"{error_msg}\n"
+            f"Please ensure the banking server is running at {self.config.base_url}"
+        )
+
+    @staticmethod
+    def _api_error(status: int, raw: bytes) -> BankingAPIError:
+        """
+        Log an HTTP error response and build the error raised for it.
+
+        Server errors are logged at ERROR. Client errors such as a 404 for an
+        unknown account are expected, so they are only logged at DEBUG.
+
+        Args:
+            status: HTTP status code of the response
+            raw: Response body
+
+        Returns:
+            BankingAPIError: Error carrying the status code and body snippet
+        """
+        level = logging.ERROR if status >= 500 else logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(level, "API error (status %s): %r", status, raw[:ERROR_BODY_LIMIT])
+        return BankingAPIError(status_code=status, body=raw)
+
+    def _attempts(self, method: str, url: URL) -> Iterator[int]:
+        """
+        Iterate over the attempt numbers allowed for a request.
+
+        Args:
+            method: HTTP method of the request
+            url: URL of the request
+
+        Yields:
+            int: Attempt number, starting at 0
+        """
+        attempts = self.config.max_retries + 1
+        for attempt in range(attempts):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{method} {url} - Attempt {attempt + 1}/{attempts}")
+            yield attempt
+
+    async def _retry_or_raise(
+        self, error: Exception, method: str, url: URL, attempt: int, retryable: bool = True
+    ):
+        """
+        Back off before retrying a transient failure, or raise it if it is final.
+
+        Args:
+            error: Timeout or connection error raised by aiohttp
+            method: HTTP method of the failed request
+            url: URL of the failed request
+            attempt: Attempt number that failed, starting at 0
+            retryable: Whether the request may be sent again at all
+
+        Raises:
+            ConnectionError: If no attempts are left or the request is not retryable
+        """
+        connection_error = self._connection_error(error, method, url)
+        if not retryable or attempt >= self.config.max_retries:
+            raise connection_error from error
+
+        # Retry transient failures with capped, jittered exponential backoff
+        await asyncio.sleep(
+            _backoff_delay(attempt, self.config.backoff_base, self.config.backoff_cap)
+        )
+
+    async def _raise_for_status(
+        self, status: int, raw: bytes, headers: Optional[Mapping[str, str]]
+    ):
+        """
+        Raise the error for an HTTP error response.
+
+        A 401 for a request sent with the stored token discards that token first.
+
+        Args:
+            status: HTTP status code of the response
+            raw: Response body
+            headers: Headers the request was sent with
+
+        Raises:
+            BankingAPIError: Always
+        """
+        if status == 401 and headers and headers is self._auth_headers:
+            await self._discard_auth_token()
+        raise self._api_error(status, raw)
+
+    async def _request_raw(
         self,
         method: str,
-        endpoint: str,
+        endpoint: Union[str, URL],
         json_data: Optional[dict] = None,
         params: Optional[dict] = None,
-        retry_count: int = 0,
-    ) -> dict:
+        headers: Optional[Mapping[str, str]] = None,
+        data: Optional[bytes] = None,
+    ) -> tuple[int, bytes]:
         """
-        Make an HTTP request with retry logic.
+        Make an HTTP request with retry logic and return the unparsed body.
+
+        Timeouts and connection errors are retried up to ``config.max_retries``
+        times with capped, jittered exponential backoff.
 
         Args:
             method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint path
+            endpoint: API endpoint path, or an absolute URL
             json_data: JSON request body
             params: Query parameters
-            retry_count: Current retry attempt
+            headers: Extra headers, replacing the stored Authorization header
+            data: Pre-encoded JSON request body, sent instead of json_data
 
         Returns:
-            dict: Parsed JSON response
+            tuple: Response status code and raw body
 
         Raises:
             BankingAPIError: On API errors
             ConnectionError: On connection failures
         """
-        if not self.session:
-            raise RuntimeError("Client session not initialized. Use async context manager.")
-
-        url = f"{self.config.base_url}{endpoint}"
+        session = await self._require_session()
 
         # Add authentication header if token is available
-        headers = {}
-        if self.auth_token and not self.auth_token.is_expired():
-            headers["Authorization"] = self.auth_token.get_header_value()
+        if headers is None and time.time() < self._auth_headers_expiry:
+            headers = self._auth_headers
 
-        try:
-            logger.debug(f"{method} {url} - Attempt {retry_count + 1}/{self.config.max_retries + 1}")
-
-            async with self.session.request(
-                method=method,
-                url=url,
-                json=json_data,
-                params=params,
-                headers=headers,
-            ) as response:
-                response_text = await response.text()
-
-                # Log response for debugging
-                logger.debug(f"Response status: {response.status}")
-                logger.debug(f"Response body: {response_text[:500]}")
-
-                # Handle non-200 responses
-                if response.status >= 400:
-                    error_msg = f"API error (status {response.status}): {response_text}"
-                    logger.error(error_msg)
-                    raise BankingAPIError(error_msg, status_code=response.status)
-
-                # Parse JSON response
-                try:
-                    return await response.json()
-                except aiohttp.ContentTypeError:
-                    # Handle non-JSON responses
-                    if response.status < 300:
-                        return {"status": "success", "message": response_text}
-                    raise BankingAPIError(f"Invalid JSON response: {response_text}")
-
-        except asyncio.TimeoutError:
-            error_msg = f"Request timeout after {self.config.timeout}s: {method} {url}"
-            logger.error(error_msg)
+        url = endpoint if isinstance(endpoint, URL) else self._url(endpoint)
 
-            # Retry on timeout
-            if retry_count < self.config.max_retries:
-                await asyncio.sleep(2 ** retry_count)  # Exponential backoff
-                return await self._make_request(
-                    method, endpoint, json_data, params, retry_count + 1
-                )
+        for attempt in self._attempts(method, url):
+            try:
+                async with session.request(
+                    method=method,
+                    url=url,
+                    json=json_data,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    timeout=self._timeout,
+                ) as response:
+                    raw = await response.read()
 
-            raise ConnectionError(error_msg)
+                    # Log response for debugging without decoding the body
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Response status: {response.status}")
+                        logger.debug("Response body[:500]: %r", raw[:500])
 
-        except aiohttp.ClientConnectionError as e:
-            error_msg = f"Connection failed: {e}"
-            logger.error(error_msg)
+                    # Handle non-200 responses
+                    if response.status >= 400:
+                        await self._raise_for_status(response.status, raw, headers)
 
-            # Retry on connection errors
-            if retry_count < self.config.max_retries:
-                await asyncio.sleep(2 ** retry_count)  # Exponential backoff
-                return await self._make_request(
-                    method, endpoint, json_data, params, retry_count + 1
-                )
+                    return response.status, raw
+
+            except TRANSIENT_ERRORS as e:
+                await self._retry_or_raise(e, method, url, attempt)
+
+            except BankingAPIError:
+                raise
 
-            raise ConnectionError(
-                f"{error_msg}\n"
-                f"Please ensure the banking server is running at {self.config.base_url}"
+            except Exception as e:
+                logger.exception(f"Unexpected error in API request: {e}")
+                raise
+
+        raise ConnectionError(f"No request attempts allowed: {method} {endpoint}")
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: Union[str, URL],
+        json_data: Optional[dict] = None,
+        params: Optional[dict] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """
+        Make an HTTP request with retry logic and parse the JSON response.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path, or an absolute URL
+            json_data: JSON request body
+            params: Query parameters
+            headers: Extra headers, replacing the stored Authorization header
+
+        Returns:
+            dict: Parsed JSON response
+
+        Raises:
+            BankingAPIError: On API errors
+            ConnectionError: On connection failures
+        """
+        status, raw = await self._request_raw(
+            method, endpoint, json_data=json_data, params=params, headers=headers
+        )
+
+        # Parse JSON response
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Handle non-JSON responses
+            if status < 300:
+                return {"status": "success", "message": raw.decode("utf-8", errors="replace")}
+            raise BankingAPIError(
+                f"Invalid JSON response (status {status})", status_code=status, body=raw
             )
 
-        except Exception as e:
-            logger.exception(f"Unexpected error in API request: {e}")
-            raise
+    async def _stream_items(
+        self, endpoint: str, prefix: str, params: Optional[dict] = None
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Make a GET request and stream items of a JSON array in the response.
+
+        Items are parsed incrementally with ijson, so the body is never held
+        in memory as a whole. Failures are only retried before the first item
+        has been yielded.
+
+        Args:
+            endpoint: API endpoint path
+            prefix: ijson prefix of the items to yield (e.g. "accounts.item")
+            params: Query parameters
+
+        Yields:
+            Any: Parsed JSON items
+
+        Raises:
+            BankingAPIError: On API errors
+            ConnectionError: On connection failures
+        """
+        session = await self._require_session()
+
+        url = self._url(endpoint)
+        headers = self._auth_headers if time.time() < self._auth_headers_expiry else None
+
+        for attempt in self._attempts("GET", url):
+            streamed = False
+            try:
+                async with session.request(
+                    method="GET",
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    timeout=self._timeout,
+                ) as response:
+                    if response.status >= 400:
+                        await self._raise_for_status(
+                            response.status, await response.read(), headers
+                        )
+
+                    async for item in ijson.items_async(response.content, prefix, use_float=True):
+                        streamed = True
+                        yield item
+                return
+
+            except TRANSIENT_ERRORS as e:
+                await self._retry_or_raise(e, "GET", url, attempt, retryable=not streamed)
+
+            except ijson.JSONError as e:
+                raise BankingAPIError(f"Invalid JSON response: {e}") from e
 
     async def get_auth_token(
         self, username: str = "alice", password: str = "any", claim: str = "transfer"
@@ -179,6 +774,9 @@ class BankingAPIClient:
         """
         Retrieve JWT authentication token from the API.
 
+        Tokens are cached in memory and in TOKEN_CACHE_PATH, and reused until
+        they are within TOKEN_EXPIRY_BUFFER seconds of their ``exp`` claim.
+
         Args:
             username: Username for authentication
             password: Password for authentication
@@ -190,6 +788,12 @@ class BankingAPIClient:
         Raises:
             BankingAPIError: On authentication failure
         """
+        cache_key = _token_cache_key(self.config.base_url, username, password, claim)
+        cached = await self._get_cached_token(cache_key)
+        if cached:
+            logger.info(f"Using cached auth token with claim: {claim}")
+            return cached.token
+
         logger.info(f"Requesting auth token with claim: {claim}")
 
         response = await self._make_request(
@@ -203,6 +807,7 @@ class BankingAPIClient:
         if not token:
             raise BankingAPIError("No token in authentication response")
 
+        await self._store_token(cache_key, token)
         logger.info("Successfully retrieved authentication token")
         return token
 
@@ -210,29 +815,72 @@ class BankingAPIClient:
         """
         Validate if an account exists and is active.
 
+        Results returned by the server are cached for VALIDATION_CACHE_TTL seconds.
+
         Args:
             account_number: Account number to validate
 
         Returns:
             bool: True if account is valid
         """
-        logger.debug(f"Validating account: {account_number}")
+        cached = self._validation_cache.get(account_number)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating account: {account_number}")
 
         try:
             response = await self._make_request(
                 method="GET",
-                endpoint=f"/accounts/validate/{account_number}",
+                endpoint=_account_url(self._account_validate_url, account_number),
             )
 
             # API returns {"isValid": true/false, "accountId": "...", "status": "ACTIVE/INACTIVE"}
             is_valid = response.get("isValid", False)
-            logger.debug(f"Account {account_number} validation: {is_valid} (status: {response.get('status', 'UNKNOWN')})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Account {account_number} validation: {is_valid} "
+                    f"(status: {response.get('status', 'UNKNOWN')})"
+                )
+            self._validation_cache[account_number] = (
+                is_valid,
+                time.monotonic() + VALIDATION_CACHE_TTL,
+            )
             return is_valid
 
         except BankingAPIError as e:
-            logger.warning(f"Account validation failed for {account_number}: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Account validation failed for {account_number}: {e}")
             return False
 
+    async def validate_accounts(self, account_numbers: list[str]) -> dict[str, bool]:
+        """
+        Validate several accounts, requesting the uncached ones concurrently.
+
+        Args:
+            account_numbers: Account numbers to validate
+
+        Returns:
+            dict: Account number -> True if account is valid, in input order
+        """
+        now = time.monotonic()
+        unique = list(dict.fromkeys(account_numbers))
+        results: dict[str, bool] = {}
+        uncached = []
+        for account_number in unique:
+            cached = self._validation_cache.get(account_number)
+            if cached and now < cached[1]:
+                results[account_number] = cached[0]
+            else:
+                uncached.append(account_number)
+
+        if uncached:
+            fetched = await asyncio.gather(*(self.validate_account(n) for n in uncached))
+            results.update(zip(uncached, fetched))
+
+        return {account_number: results[account_number] for account_number in unique}
+
     async def get_account_balance(self, account_number: str) -> dict:
         """
         Get account balance information.
@@ -246,17 +894,38 @@ class BankingAPIClient:
         Raises:
             BankingAPIError: On API errors
         """
-        logger.debug(f"Fetching balance for account: {account_number}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Fetching balance for account: {account_number}")
 
         response = await self._make_request(
             method="GET",
-            endpoint=f"/accounts/balance/{account_number}",
+            endpoint=_account_url(self._account_balance_url, account_number),
         )
         
         # API returns {"accountId": "ACC1000", "balance": 1000.00, "currency": "USD", "status": "ACTIVE"}
-        logger.debug(f"Account {account_number} balance: {response.get('balance', 0)} {response.get('currency', 'USD')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Account {account_number} balance: "
+                f"{response.get('balance', 0)} {response.get('currency', 'USD')}"
+            )
         return response
 
+    async def iter_accounts(self) -> AsyncGenerator[dict, None]:
+        """
+        Stream all available accounts as they are parsed from the response.
+
+        Yields:
+            dict: Account information
+
+        Raises:
+            BankingAPIError: On API errors
+        """
+        logger.debug("Fetching all accounts")
+
+        # API returns {"accounts": [...], "totalAccounts": 100, "bonusPoints": "..."}
+        async for account in self._stream_items("/accounts", "accounts.item"):
+            yield account
+
     async def list_accounts(self) -> list:
         """
         List all available accounts.
@@ -267,20 +936,9 @@ class BankingAPIClient:
         Raises:
             BankingAPIError: On API errors
         """
-        logger.debug("Fetching all accounts")
-
-        response = await self._make_request(
-            method="GET",
-            endpoint="/accounts",
-        )
-
-        # API returns {"accounts": [...], "totalAccounts": 100, "bonusPoints": "..."}
-        if isinstance(response, dict) and "accounts" in response:
-            accounts = response["accounts"]
-            logger.info(f"Retrieved {len(accounts)} accounts")
-            return accounts
-        
-        return response if isinstance(response, list) else []
+        accounts = [account async for account in self.iter_accounts()]
+        logger.info(f"Retrieved {len(accounts)} accounts")
+        return accounts
 
     async def transfer(self, transfer_data: dict) -> dict:
         """
@@ -308,12 +966,47 @@ class BankingAPIClient:
             json_data=transfer_data,
         )
 
-    async def validate_token(self, token: str) -> bool:
+    async def transfer_raw(self, request_body: bytes) -> bytes:
+        """
+        Execute a fund transfer from a pre-encoded body, returning the raw response.
+
+        Lets callers encode the request and decode the response themselves,
+        without an intermediate dict on either side.
+
+        Args:
+            request_body: JSON-encoded transfer request (see transfer())
+
+        Returns:
+            bytes: Raw body of a 2xx transfer response
+
+        Raises:
+            BankingAPIError: On transfer failure, including any non-2xx status
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Executing transfer: {request_body.decode()}")
+
+        status, raw = await self._request_raw(
+            method="POST", endpoint="/transfer", data=request_body
+        )
+
+        # Only a 2xx response means the transfer went through
+        if status >= 300:
+            raise BankingAPIError(
+                f"Unexpected transfer response (status {status})", status_code=status, body=raw
+            )
+        return raw
+
+    async def validate_token(self, token: str, online: bool = False) -> bool:
         """
-        Validate JWT token using the /auth/validate endpoint (BONUS).
+        Validate JWT token, optionally using the /auth/validate endpoint (BONUS).
+
+        The token must be a well-formed JWT whose ``exp`` claim, if present,
+        lies in the future. This check is local and does not verify the
+        signature; pass ``online=True`` to also have the server validate it.
 
         Args:
             token: JWT token to validate
+            online: Also validate the token with the server
 
         Returns:
             bool: True if token is valid
@@ -323,19 +1016,33 @@ class BankingAPIClient:
         """
         logger.debug("Validating JWT token")
 
-        try:
-            # Temporarily set token for this request
-            original_token = self.auth_token
-            self.auth_token = AuthToken(token=token)
+        parts = token.split(".")
+        if len(parts) != 3:
+            logger.debug("Token rejected: not a JWT")
+            return False
+
+        header = _decode_jwt_segment(parts[0])
+        payload = _decode_jwt_segment(parts[1])
+        if header is None or payload is None:
+            logger.debug("Token rejected: malformed header or payload")
+            return False
+
+        exp = payload.get("exp")
+        if exp is not None and (not isinstance(exp, (int, float)) or exp <= time.time()):
+            logger.debug("Token rejected: expired")
+            return False
+
+        if not online:
+            return True
 
+        try:
+            # Send the token under test without touching the client's own token
             response = await self._make_request(
                 method="POST",
                 endpoint="/auth/validate",
+                headers=_auth_headers(AuthToken(token=token)),
             )
 
-            # Restore original token
-            self.auth_token = original_token
-
             is_valid = response.get("valid", False)
             logger.debug(f"Token validation result: {is_valid}")
             return is_valid
@@ -344,33 +1051,51 @@ class BankingAPIClient:
             logger.warning(f"Token validation failed: {e}")
             return False
 
-    async def get_transaction_history(
+    async def iter_transaction_history(
         self, account_number: Optional[str] = None, limit: int = 10
-    ) -> list:
+    ) -> AsyncGenerator[dict, None]:
         """
-        Get transaction history (BONUS endpoint - requires authentication).
+        Stream transaction history (BONUS endpoint - requires authentication).
 
         Args:
             account_number: Optional account number to filter by
             limit: Maximum number of transactions to return
 
-        Returns:
-            list: List of transaction records
+        Yields:
+            dict: Transaction record
 
         Raises:
             BankingAPIError: On API errors
         """
         logger.debug(f"Fetching transaction history for account: {account_number}")
 
-        params = {"limit": limit}
+        params: dict[str, Any] = {"limit": limit}
         if account_number:
             params["accountNumber"] = account_number
 
-        response = await self._make_request(
-            method="GET",
-            endpoint="/transactions/history",
-            params=params,
-        )
-        
         # API returns: {"transactions": [...], "totalReturned": n, "bonusPoints": "..."}
-        return response.get("transactions", [])
+        async for transaction in self._stream_items(
+            "/transactions/history", "transactions.item", params=params
+        ):
+            yield transaction
+
+    async def get_transaction_history(
+        self, account_number: Optional[str] = None, limit: int = 10
+    ) -> list:
+        """
+        Get transaction history (BONUS endpoint - requires authentication).
+
+        Args:
+            account_number: Optional account number to filter by
+            limit: Maximum number of transactions to return
+
+        Returns:
+            list: List of transaction records
+
+        Raises:
+            BankingAPIError: On API errors
+        """
+        return [
+            transaction
+            async for transaction in self.iter_transaction_history(account_number, limit)
+        ]
@@ -21,29 +21,81 @@ Date: November 2025
 
 import argparse
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from decimal import Decimal
+from contextlib import aclosing
+from decimal import Decimal, InvalidOperation
 from typing import Optional
 
-from api_client import BankingAPIClient
 from config import Config
-from models import TransferRequest, TransferResponse
-from services import TransferService
-
-# Configure structured logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("banking_client.log"),
-    ],
-)
 
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> logging.handlers.QueueListener:
+    """
+    Configure structured logging for the CLI.
+
+    Console output is written directly so it stays in order with print()
+    output. The log file is written by a QueueListener thread so disk I/O
+    never blocks the event loop.
+
+    Returns:
+        logging.handlers.QueueListener: Started listener, stopped at exit
+    """
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    file_handler = logging.FileHandler("banking_client.log", delay=True)
+    file_handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(console_handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    return listener
+
+
+def write_lines(*lines: str):
+    """Write a block of output lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def parse_amount(value: str) -> Decimal:
+    """
+    Parse a transfer amount straight into a Decimal, without a float round-trip.
+
+    Args:
+        value: Amount as typed on the command line
+
+    Returns:
+        Decimal: Parsed amount
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a finite number
+    """
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        raise argparse.ArgumentTypeError(f"invalid amount: {value!r}")
+
+    if not amount.is_finite():
+        raise argparse.ArgumentTypeError(f"invalid amount: {value!r}")
+
+    return amount
+
+
 async def main() -> int:
     """
     Main entry point for the banking client CLI.
@@ -78,7 +130,7 @@ Examples:
 
     parser.add_argument(
         "--amount",
-        type=float,
+        type=parse_amount,
         required=False,
         help="Transfer amount (e.g., 100.00)",
     )
@@ -138,6 +190,15 @@ Examples:
         if not args.from_account or not args.to_account or args.amount is None:
             parser.error("Transfer mode requires --from, --to, and --amount")
 
+    # Deferred until arguments are valid so --help and usage errors skip
+    # importing aiohttp and never touch the log file
+    from api_client import BankingAPIClient
+    from models import TransferRequest
+    from services import TransferService
+
+    # Configure structured logging
+    configure_logging()
+
     # Enable debug logging if requested
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -153,47 +214,75 @@ Examples:
             transfer_service = TransferService(api_client)
 
             # Authenticate if requested
+            token = None
             if args.auth:
                 logger.info("Retrieving authentication token...")
                 token = await transfer_service.authenticate()
                 if token:
                     logger.info("✓ Authentication successful")
-                    
-                    # Validate token using bonus endpoint
-                    is_valid = await transfer_service.validate_token(token)
-                    if is_valid:
-                        logger.info("✓ Token validated successfully")
-                    else:
-                        logger.warning("⚠ Token validation failed")
                 else:
                     logger.warning("⚠ Authentication failed, proceeding without token")
 
+            # Start account validation once the token is set, so the requests are
+            # authenticated, and only wait for the result right before the transfer
+            validation = None
+            if args.validate and args.from_account and args.to_account and args.amount is not None:
+                logger.info("Validating accounts...")
+                validation = asyncio.create_task(
+                    transfer_service.validate_accounts([args.from_account, args.to_account])
+                )
+
+            # Validate token using bonus endpoint
+            if token:
+                is_valid = await transfer_service.validate_token(token, online=True)
+                if is_valid:
+                    logger.info("✓ Token validated successfully")
+                else:
+                    logger.warning("⚠ Token validation failed")
+
             # Show transaction history if requested
             if args.history:
                 logger.info("Fetching transaction history...")
                 try:
                     # Use from_account if provided, otherwise get all history (pass None)
                     account_number = args.from_account if args.from_account else None
-                    history = await transfer_service.get_transaction_history(
+                    history = transfer_service.iter_transaction_history(
                         account_number=account_number,
                         limit=args.history_limit
                     )
-                    
-                    if history:
-                        account_info = f" for {account_number}" if account_number else ""
-                        print(f"\n{'='*60}")
-                        print(f"📜 Transaction History{account_info}")
-                        print(f"{'='*60}")
-                        for i, txn in enumerate(history[:args.history_limit], 1):
-                            print(f"{i:2}. {txn.get('timestamp', 'N/A')[:19]}")
-                            print(f"    Transaction ID: {txn.get('transactionId', 'N/A')}")
-                            print(f"    Type: {txn.get('type', 'N/A')}")
-                            print(f"    Amount: ${txn.get('amount', 0):.2f}")
-                            print(f"    Status: {txn.get('status', 'N/A')}")
+
+                    # Format transactions as they are streamed, then write them at once
+                    lines = []
+                    shown = 0
+                    async with aclosing(history):
+                        async for txn in history:
+                            if shown == args.history_limit:
+                                break
+                            shown += 1
+
+                            lines.append(f"{shown:2}. {txn.get('timestamp', 'N/A')[:19]}")
+                            lines.append(f"    Transaction ID: {txn.get('transactionId', 'N/A')}")
+                            lines.append(f"    Type: {txn.get('type', 'N/A')}")
+                            lines.append(f"    Amount: ${txn.get('amount', 0):.2f}")
+                            lines.append(f"    Status: {txn.get('status', 'N/A')}")
                             if txn.get('fromAccount'):
-                                print(f"    From: {txn['fromAccount']} → To: {txn.get('toAccount', 'N/A')}")
-                            print()
-                        print(f"{'='*60}\n")
+                                lines.append(
+                                    f"    From: {txn['fromAccount']} → "
+                                    f"To: {txn.get('toAccount', 'N/A')}"
+                                )
+                            lines.append("")
+
+                    if shown:
+                        account_info = f" for {account_number}" if account_number else ""
+                        write_lines(
+                            "",
+                            "=" * 60,
+                            f"📜 Transaction History{account_info}",
+                            "=" * 60,
+                            *lines,
+                            "=" * 60,
+                            "",
+                        )
                     else:
                         print("\n📜 No transaction history found\n")
                         
@@ -214,20 +303,24 @@ Examples:
             if args.check_balance:
                 logger.info("Checking account balances...")
                 try:
-                    from_balance = await transfer_service.get_balance(args.from_account)
-                    to_balance = await transfer_service.get_balance(args.to_account)
+                    from_balance, to_balance = await asyncio.gather(
+                        transfer_service.get_balance(args.from_account),
+                        transfer_service.get_balance(args.to_account),
+                    )
                     
-                    print(f"\n📊 Account Balances:")
-                    print(f"  From ({args.from_account}): ${from_balance.get('balance', 0):.2f}")
-                    print(f"  To   ({args.to_account}): ${to_balance.get('balance', 0):.2f}\n")
+                    write_lines(
+                        "",
+                        "📊 Account Balances:",
+                        f"  From ({args.from_account}): ${from_balance.get('balance', 0):.2f}",
+                        f"  To   ({args.to_account}): ${to_balance.get('balance', 0):.2f}",
+                        "",
+                    )
                 except Exception as e:
                     logger.warning(f"Could not retrieve balances: {e}")
 
             # Validate accounts if requested
-            if args.validate:
-                logger.info("Validating accounts...")
-                from_valid = await transfer_service.validate_account(args.from_account)
-                to_valid = await transfer_service.validate_account(args.to_account)
+            if validation is not None:
+                from_valid, to_valid = await validation
 
                 if not from_valid:
                     logger.error(f"✗ Invalid source account: {args.from_account}")
@@ -243,7 +336,7 @@ Examples:
             transfer_request = TransferRequest(
                 from_account=args.from_account,
                 to_account=args.to_account,
-                amount=Decimal(str(args.amount)),
+                amount=args.amount,
             )
 
             logger.info(f"Initiating transfer: {transfer_request}")
@@ -252,24 +345,28 @@ Examples:
             response = await transfer_service.transfer(transfer_request)
 
             # Display results
-            print("\n" + "=" * 60)
-            print("✅ TRANSFER SUCCESSFUL!")
-            print("=" * 60)
-            print(f"Transaction ID:    {response.transaction_id}")
-            print(f"Status:            {response.status}")
-            print(f"From Account:      {response.from_account}")
-            print(f"To Account:        {response.to_account}")
-            print(f"Amount:            ${response.amount:.2f}")
-            print(f"Timestamp:         {response.timestamp}")
+            lines = [
+                "",
+                "=" * 60,
+                "✅ TRANSFER SUCCESSFUL!",
+                "=" * 60,
+                f"Transaction ID:    {response.transaction_id}",
+                f"Status:            {response.status}",
+                f"From Account:      {response.from_account}",
+                f"To Account:        {response.to_account}",
+                f"Amount:            ${response.amount:.2f}",
+                f"Timestamp:         {response.timestamp}",
+            ]
             if response.message:
-                print(f"Message:           {response.message}")
+                lines.append(f"Message:           {response.message}")
             if response.bonus_points:
-                print(f"Bonus Points:      {response.bonus_points}")
+                lines.append(f"Bonus Points:      {response.bonus_points}")
             if response.permission_level:
-                print(f"Permission Level:  {response.permission_level}")
+                lines.append(f"Permission Level:  {response.permission_level}")
             if response.new_from_balance:
-                print(f"New From Balance:  ${response.new_from_balance:.2f}")
-            print("=" * 60 + "\n")
+                lines.append(f"New From Balance:  ${response.new_from_balance:.2f}")
+            lines.extend(["=" * 60, ""])
+            write_lines(*lines)
 
             logger.info(f"Transfer completed successfully: {response.transaction_id}")
             return 0
@@ -4,15 +4,32 @@ Configuration management for the banking client.
 Supports loading from JSON files and environment variables.
 """
 
+import functools
 import json
 import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Configuration file used when no explicit path is given
+_DEFAULT_CONFIG_PATH = Path(__file__).parent / "config" / "settings.json"
+
+# Environment variables overriding configuration: (variable, field, converter)
+_ENV_MAP = (
+    ("BANKING_API_URL", "base_url", str),
+    ("BANKING_API_TIMEOUT", "timeout", int),
+    ("BANKING_API_MAX_RETRIES", "max_retries", int),
+    ("BANKING_API_POOL_SIZE", "pool_size", int),
+    ("BANKING_API_POOL_SIZE_PER_HOST", "pool_size_per_host", int),
+    ("BANKING_API_KEEPALIVE_TIMEOUT", "keepalive_timeout", int),
+    ("LOG_LEVEL", "log_level", str),
+)
+
 
 @dataclass
 class Config:
@@ -29,6 +46,11 @@ class Config:
     timeout: int = 30
     max_retries: int = 3
     log_level: str = "INFO"
+    pool_size: int = 32
+    pool_size_per_host: int = 16
+    keepalive_timeout: int = 75
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
 
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> "Config":
@@ -41,68 +63,101 @@ class Config:
         3. Default configuration file (config/settings.json)
         4. Default values
 
+        Files are read once per process; use reload() to pick up edits.
+
+        Args:
+            config_path: Optional path to configuration file
+
+        Returns:
+            Config: Configuration instance
+        """
+        env_snapshot = frozenset(
+            (name, os.environ[name]) for name, _, _ in _ENV_MAP if name in os.environ
+        )
+
+        # Create config instance
+        config = cls(**cls._load_cached(config_path, env_snapshot))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Configuration loaded: base_url={config.base_url}")
+
+        return config
+
+    @classmethod
+    def reload(cls, config_path: Optional[str] = None) -> "Config":
+        """
+        Load configuration again, discarding everything cached by load().
+
         Args:
             config_path: Optional path to configuration file
 
         Returns:
             Config: Configuration instance
         """
+        cls._load_cached.cache_clear()
+        return cls.load(config_path)
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_cached(
+        cls, config_path: Optional[str], env_snapshot: frozenset[tuple[str, str]]
+    ) -> dict:
+        """
+        Resolve configuration data, memoized per file and environment.
+
+        Repeated loads with the same file and the same relevant environment
+        variables skip reading and parsing the file again.
+
+        Args:
+            config_path: Optional path to configuration file
+            env_snapshot: (name, value) pairs of the _ENV_MAP variables that are set
+
+        Returns:
+            dict: Keyword arguments for the Config constructor; must not be mutated
+        """
         config_data = {}
 
-        # Try to load from file
+        # Try to load from file, falling back to the default config location
         if config_path:
             config_data = cls._load_from_file(config_path)
         else:
-            # Try default config location
-            default_path = Path(__file__).parent / "config" / "settings.json"
-            if default_path.exists():
-                config_data = cls._load_from_file(str(default_path))
+            config_data = cls._load_from_file(_DEFAULT_CONFIG_PATH, missing_ok=True)
 
         # Override with environment variables
-        if os.getenv("BANKING_API_URL"):
-            config_data["base_url"] = os.getenv("BANKING_API_URL")
-
-        if os.getenv("BANKING_API_TIMEOUT"):
-            try:
-                config_data["timeout"] = int(os.getenv("BANKING_API_TIMEOUT"))
-            except ValueError:
-                logger.warning("Invalid BANKING_API_TIMEOUT value, using default")
-
-        if os.getenv("BANKING_API_MAX_RETRIES"):
+        env = dict(env_snapshot)
+        for env_name, field_name, convert in _ENV_MAP:
+            value = env.get(env_name)
+            if not value:
+                continue
             try:
-                config_data["max_retries"] = int(os.getenv("BANKING_API_MAX_RETRIES"))
+                config_data[field_name] = convert(value)
             except ValueError:
-                logger.warning("Invalid BANKING_API_MAX_RETRIES value, using default")
+                logger.warning(f"Invalid {env_name} value, using default")
 
-        if os.getenv("LOG_LEVEL"):
-            config_data["log_level"] = os.getenv("LOG_LEVEL")
-
-        # Create config instance
-        config = cls(**config_data)
-        logger.info(f"Configuration loaded: base_url={config.base_url}")
-
-        return config
+        return config_data
 
     @staticmethod
-    def _load_from_file(file_path: str) -> dict:
+    def _load_from_file(file_path: Union[str, Path], missing_ok: bool = False) -> dict:
         """
         Load configuration from JSON file.
 
         Args:
             file_path: Path to JSON configuration file
+            missing_ok: Return an empty configuration without warning if the file is absent
 
         Returns:
             dict: Configuration data
         """
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                logger.info(f"Loaded configuration from: {file_path}")
+            with open(file_path, "rb") as f:
+                data = orjson.loads(f.read())
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Loaded configuration from: {file_path}")
                 return data
         except FileNotFoundError:
-            logger.warning(f"Configuration file not found: {file_path}")
+            if not missing_ok:
+                logger.warning(f"Configuration file not found: {file_path}")
             return {}
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in configuration file: {e}")
             return {}
         except Exception as e:
@@ -116,6 +171,11 @@ class Config:
             "timeout": self.timeout,
             "max_retries": self.max_retries,
             "log_level": self.log_level,
+            "pool_size": self.pool_size,
+            "pool_size_per_host": self.pool_size_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "backoff_base": self.backoff_base,
+            "backoff_cap": self.backoff_cap,
         }
 
     def save(self, file_path: str):
@@ -1,66 +1,143 @@
 """
 Data models for the banking client.
 
-Uses Python dataclasses for clean, immutable data structures.
+Uses slotted Python dataclasses for clean, immutable data structures.
 All models include type hints and validation.
 """
 
+from __future__ import annotations
+
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any
+
+import orjson
+
+# Compared against in validation, so 0 is not coerced to Decimal per check
+_DEC_ZERO = Decimal("0")
+
+# (epoch seconds, ISO string) of the last timestamp produced by _now_iso()
+_now_iso_cache: tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Return the current local time in ISO format, reused for up to a millisecond."""
+    global _now_iso_cache
+
+    now = time.time()
+    if abs(now - _now_iso_cache[0]) > 0.001:
+        _now_iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _now_iso_cache[1]
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a JSON-decoded number to Decimal, branching once on its type."""
+    value_type = type(value)
+    if value_type is float:
+        # repr() is the shortest round-tripping form, so 0.1 becomes Decimal("0.1")
+        return Decimal(repr(value))
+    if value_type is int or value_type is str:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings such as statuses and account numbers."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _transfer_payload(from_account: str, to_account: str, amount: Decimal) -> dict:
+    """Build the JSON request body of a transfer."""
+    return {"fromAccount": from_account, "toAccount": to_account, "amount": float(amount)}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Account:
     """Represents a bank account."""
 
     account_number: str
-    balance: Optional[Decimal] = None
-    status: Optional[str] = None
+    balance: Decimal | None = None
+    status: str | None = None
 
     def __post_init__(self):
         """Validate account data."""
-        if not self.account_number or not self.account_number.strip():
+        account_number = self.account_number
+        if not account_number or account_number.isspace():
             raise ValueError("Account number cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransferRequest:
     """Request model for fund transfers."""
 
     from_account: str
     to_account: str
     amount: Decimal
+    _payload: dict = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate transfer request data."""
-        if not self.from_account or not self.from_account.strip():
+        from_account = self.from_account
+        to_account = self.to_account
+
+        # isspace() checks for blank input without allocating a stripped copy
+        if not from_account or from_account.isspace():
             raise ValueError("Source account cannot be empty")
 
-        if not self.to_account or not self.to_account.strip():
+        if not to_account or to_account.isspace():
             raise ValueError("Destination account cannot be empty")
 
-        if self.from_account == self.to_account:
+        if from_account == to_account:
             raise ValueError("Source and destination accounts must be different")
 
-        if self.amount <= 0:
+        if self.amount <= _DEC_ZERO:
             raise ValueError("Transfer amount must be positive")
 
+        # Build the request body once; the instance is immutable
+        payload = _transfer_payload(from_account, to_account, self.amount)
+        object.__setattr__(self, "_payload", payload)
+
+    @classmethod
+    def construct(cls, from_account: str, to_account: str, amount: Decimal) -> TransferRequest:
+        """
+        Create an instance without running validation.
+
+        Only use this for input that has already been validated, such as
+        fields copied from another TransferRequest. Invalid data is sent to
+        the server as is.
+
+        Args:
+            from_account: Source account number
+            to_account: Destination account number
+            amount: Transfer amount
+
+        Returns:
+            TransferRequest: Unvalidated request
+        """
+        request = object.__new__(cls)
+        object.__setattr__(request, "from_account", from_account)
+        object.__setattr__(request, "to_account", to_account)
+        object.__setattr__(request, "amount", amount)
+        object.__setattr__(request, "_payload", _transfer_payload(from_account, to_account, amount))
+        return request
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "fromAccount": self.from_account,
-            "toAccount": self.to_account,
-            "amount": float(self.amount),
-        }
+        return self._payload.copy()
+
+    def to_json(self) -> bytes:
+        """Serialize to a JSON request body."""
+        return orjson.dumps(self._payload)
 
     def __str__(self) -> str:
         """Human-readable representation."""
         return f"{self.from_account} → {self.to_account}: ${self.amount:.2f}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransferResponse:
     """Response model for fund transfers."""
 
@@ -70,53 +147,72 @@ class TransferResponse:
     to_account: str
     amount: Decimal
     timestamp: str
-    message: Optional[str] = None
-    bonus_points: Optional[str] = None
-    permission_level: Optional[str] = None
-    new_from_balance: Optional[Decimal] = None
-    new_to_balance: Optional[Decimal] = None
+    message: str | None = None
+    bonus_points: str | None = None
+    permission_level: str | None = None
+    new_from_balance: Decimal | None = None
+    new_to_balance: Decimal | None = None
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> TransferResponse:
+        """Create instance directly from a JSON response body."""
+        return cls.from_dict(orjson.loads(raw))
 
     @classmethod
-    def from_dict(cls, data: dict) -> "TransferResponse":
+    def from_dict(cls, data: dict) -> TransferResponse:
         """Create instance from API response dictionary."""
+        get = data.get
+
         # Handle timestamp - use current time if not provided
-        timestamp = data.get("timestamp") or data.get("issuedAt") or datetime.now().isoformat()
-        
+        timestamp = get("timestamp") or get("issuedAt") or _now_iso()
+        new_from_balance = get("newFromAccountBalance")
+        new_to_balance = get("newToAccountBalance")
+
         return cls(
-            transaction_id=data.get("transactionId", ""),
-            status=data.get("status", "UNKNOWN"),
-            from_account=data.get("fromAccount", ""),
-            to_account=data.get("toAccount", ""),
-            amount=Decimal(str(data.get("amount", 0))),
+            transaction_id=get("transactionId", ""),
+            status=_intern(get("status", "UNKNOWN")),
+            from_account=_intern(get("fromAccount", "")),
+            to_account=_intern(get("toAccount", "")),
+            amount=_to_decimal(get("amount", 0)),
             timestamp=timestamp,
-            message=data.get("message"),
-            bonus_points=data.get("bonusPoints"),
-            permission_level=data.get("permissionLevel"),
-            new_from_balance=Decimal(str(data.get("newFromAccountBalance", 0))) if data.get("newFromAccountBalance") else None,
-            new_to_balance=Decimal(str(data.get("newToAccountBalance", 0))) if data.get("newToAccountBalance") else None,
+            message=get("message"),
+            bonus_points=get("bonusPoints"),
+            permission_level=get("permissionLevel"),
+            new_from_balance=_to_decimal(new_from_balance) if new_from_balance else None,
+            new_to_balance=_to_decimal(new_to_balance) if new_to_balance else None,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthToken:
     """Authentication token model."""
 
     token: str
-    expires_at: Optional[datetime] = None
+    expires_at: datetime | None = None
     token_type: str = "Bearer"
+    _exp_epoch: float | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the expiry as epoch seconds for cheap expiry checks."""
+        object.__setattr__(
+            self, "_exp_epoch", self.expires_at.timestamp() if self.expires_at else None
+        )
+
+    @property
+    def expires_epoch(self) -> float | None:
+        """Expiry as epoch seconds, or None if the token does not expire."""
+        return self._exp_epoch
 
     def is_expired(self) -> bool:
         """Check if token is expired."""
-        if not self.expires_at:
-            return False
-        return datetime.now() >= self.expires_at
+        return self._exp_epoch is not None and time.time() >= self._exp_epoch
 
     def get_header_value(self) -> str:
         """Get formatted token for Authorization header."""
         return f"{self.token_type} {self.token}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountBalance:
     """Account balance information."""
 
@@ -126,10 +222,10 @@ class AccountBalance:
     last_updated: datetime = field(default_factory=datetime.now)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "AccountBalance":
+    def from_dict(cls, data: dict) -> AccountBalance:
         """Create instance from API response dictionary."""
         return cls(
             account_number=data.get("accountNumber", ""),
-            balance=Decimal(str(data.get("balance", 0))),
+            balance=_to_decimal(data.get("balance", 0)),
             currency=data.get("currency", "USD"),
         )
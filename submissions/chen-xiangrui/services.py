@@ -5,10 +5,16 @@ Implements the service layer pattern to separate business logic
 from API client and presentation concerns.
 """
 
+from __future__ import annotations
+
+import asyncio
 import logging
-from typing import Optional
+from typing import AsyncGenerator
+
+import orjson
 
 from api_client import BankingAPIClient
+from config import Config
 from models import TransferRequest, TransferResponse
 
 logger = logging.getLogger(__name__)
@@ -22,18 +28,37 @@ class TransferService:
     delegating HTTP operations to the API client.
     """
 
-    def __init__(self, api_client: BankingAPIClient):
+    def __init__(self, api_client: BankingAPIClient | None = None, config: Config | None = None):
         """
         Initialize the transfer service.
 
+        Without an API client, the service creates its own. That client
+        connects on first use and keeps one pooled session for every call
+        until close() is awaited.
+
         Args:
-            api_client: Banking API client instance
+            api_client: Banking API client instance, owned by the caller
+            config: Configuration for the service's own client (defaults to Config.load())
         """
-        self.api_client = api_client
+        self._owns_client = api_client is None
+        self.api_client = api_client or BankingAPIClient(config or Config.load())
+
+    async def close(self):
+        """Release the service's own API client; a caller's client is left open."""
+        if self._owns_client:
+            await self.api_client.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
 
     async def authenticate(
         self, username: str = "alice", password: str = "any"
-    ) -> Optional[str]:
+    ) -> str | None:
         """
         Authenticate and retrieve JWT token.
 
@@ -53,7 +78,7 @@ class TransferService:
             return token
 
         except Exception as e:
-            logger.error(f"Authentication failed: {e}")
+            logger.error("Authentication failed: %s", e)
             return None
 
     async def validate_account(self, account_number: str) -> bool:
@@ -69,9 +94,26 @@ class TransferService:
         try:
             return await self.api_client.validate_account(account_number)
         except Exception as e:
-            logger.error(f"Account validation error for {account_number}: {e}")
+            logger.error("Account validation error for %s: %s", account_number, e)
             return False
 
+    async def validate_accounts(self, account_numbers: list[str]) -> list[bool]:
+        """
+        Validate several account numbers concurrently.
+
+        Args:
+            account_numbers: Account numbers to validate
+
+        Returns:
+            list: True for each valid account, in input order
+        """
+        try:
+            results = await self.api_client.validate_accounts(account_numbers)
+        except Exception as e:
+            logger.error("Account validation error for %s: %s", account_numbers, e)
+            return [False] * len(account_numbers)
+        return [results[account_number] for account_number in account_numbers]
+
     async def transfer(self, request: TransferRequest) -> TransferResponse:
         """
         Execute a fund transfer.
@@ -86,17 +128,63 @@ class TransferService:
             ValueError: If request validation fails
             BankingAPIError: If transfer fails
         """
-        logger.info(f"Processing transfer request: {request}")
+        logger.info("Processing transfer request: %s", request)
 
-        # Execute transfer via API client
-        response_data = await self.api_client.transfer(request.to_dict())
+        # Execute transfer via API client, decoding the body straight into the model
+        raw = await self.api_client.transfer_raw(request.to_json())
 
-        # Parse response into model
-        response = TransferResponse.from_dict(response_data)
+        try:
+            response = TransferResponse.from_json(raw)
+        except orjson.JSONDecodeError:
+            # Plain-text 2xx bodies, as BankingAPIClient._make_request handles them
+            response = TransferResponse.from_dict(
+                {"status": "success", "message": raw.decode("utf-8", errors="replace")}
+            )
 
-        logger.info(f"Transfer completed successfully: {response.transaction_id}")
+        logger.info("Transfer completed successfully: %s", response.transaction_id)
         return response
 
+    async def transfer_many(
+        self, requests: list[TransferRequest], concurrency: int | None = None
+    ) -> list[TransferResponse | BaseException]:
+        """
+        Execute several fund transfers concurrently.
+
+        A failed transfer does not cancel the others; its exception is
+        returned in its place so callers can tell which transfers went through.
+
+        Args:
+            requests: TransferRequest objects with transfer details
+            concurrency: Maximum transfers in flight (defaults to config.pool_size_per_host,
+                then config.pool_size; unlimited if both are 0, as in aiohttp)
+
+        Returns:
+            list: TransferResponse or the raised exception for each request, in input order
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency is None:
+            config = self.api_client.config
+            concurrency = config.pool_size_per_host or config.pool_size or None
+        elif concurrency < 1:
+            raise ValueError("Transfer concurrency must be at least 1")
+
+        if concurrency is None:
+            return await asyncio.gather(
+                *(self.transfer(request) for request in requests), return_exceptions=True
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited_transfer(request: TransferRequest) -> TransferResponse:
+            async with semaphore:
+                return await self.transfer(request)
+
+        return await asyncio.gather(
+            *(limited_transfer(request) for request in requests), return_exceptions=True
+        )
+
     async def get_balance(self, account_number: str) -> dict:
         """
         Get account balance.
@@ -110,7 +198,7 @@ class TransferService:
         try:
             return await self.api_client.get_account_balance(account_number)
         except Exception as e:
-            logger.error(f"Failed to retrieve balance for {account_number}: {e}")
+            logger.error("Failed to retrieve balance for %s: %s", account_number, e)
             raise
 
     async def list_accounts(self) -> list:
@@ -123,27 +211,50 @@ class TransferService:
         try:
             return await self.api_client.list_accounts()
         except Exception as e:
-            logger.error(f"Failed to list accounts: {e}")
+            logger.error("Failed to list accounts: %s", e)
             raise
 
-    async def validate_token(self, token: str) -> bool:
+    async def validate_token(self, token: str, online: bool = False) -> bool:
         """
-        Validate a JWT token using the /auth/validate endpoint (BONUS).
+        Validate a JWT token, optionally using the /auth/validate endpoint (BONUS).
 
         Args:
             token: JWT token to validate
+            online: Also validate the token with the server
 
         Returns:
             bool: True if token is valid
         """
         try:
-            return await self.api_client.validate_token(token)
+            return await self.api_client.validate_token(token, online=online)
         except Exception as e:
-            logger.error(f"Token validation error: {e}")
+            logger.error("Token validation error: %s", e)
             return False
 
+    async def iter_transaction_history(
+        self, account_number: str | None = None, limit: int = 10
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Stream transaction history (BONUS endpoint - requires authentication).
+
+        Args:
+            account_number: Optional account number to filter
+            limit: Maximum transactions to return
+
+        Yields:
+            dict: Transaction record
+        """
+        try:
+            async for transaction in self.api_client.iter_transaction_history(
+                account_number, limit
+            ):
+                yield transaction
+        except Exception as e:
+            logger.error("Failed to retrieve transaction history: %s", e)
+            raise
+
     async def get_transaction_history(
-        self, account_number: str = None, limit: int = 10
+        self, account_number: str | None = None, limit: int = 10
     ) -> list:
         """
         Get transaction history (BONUS endpoint - requires authentication).
@@ -158,5 +269,5 @@ class TransferService:
         try:
             return await self.api_client.get_transaction_history(account_number, limit)
         except Exception as e:
-            logger.error(f"Failed to retrieve transaction history: {e}")
+            logger.error("Failed to retrieve transaction history: %s", e)
             raise
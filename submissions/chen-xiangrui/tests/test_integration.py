@@ -38,8 +38,7 @@ async def test_full_transfer_flow(config):
         service = TransferService(api_client)
 
         # Test 1: Validate accounts
-        from_valid = await service.validate_account("ACC1000")
-        to_valid = await service.validate_account("ACC1001")
+        from_valid, to_valid = await service.validate_accounts(["ACC1000", "ACC1001"])
 
         assert from_valid is True, "Source account should be valid"
         assert to_valid is True, "Destination account should be valid"
@@ -100,6 +99,24 @@ async def test_invalid_account_transfer(config):
         assert invalid is False, "Invalid account should fail validation"
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_transfer_many(config):
+    """Test concurrent transfers return one result per request, in order."""
+    async with BankingAPIClient(config) as api_client:
+        service = TransferService(api_client)
+
+        requests = [
+            TransferRequest(from_account="ACC1000", to_account="ACC1001", amount=Decimal("1.00")),
+            TransferRequest(from_account="ACC1001", to_account="ACC1000", amount=Decimal("2.00")),
+        ]
+
+        responses = await service.transfer_many(requests, concurrency=2)
+
+        assert not any(isinstance(response, BaseException) for response in responses)
+        assert [response.amount for response in responses] == [Decimal("1.00"), Decimal("2.00")]
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_list_accounts(config):
@@ -120,10 +137,12 @@ if __name__ == "__main__":
 
     config = Config(base_url="http://localhost:8123")
 
-    # Run all tests
-    asyncio.run(test_full_transfer_flow(config))
-    asyncio.run(test_authenticated_transfer(config))
-    asyncio.run(test_invalid_account_transfer(config))
-    asyncio.run(test_list_accounts(config))
+    # Run all tests on one event loop instead of a fresh loop per test
+    with asyncio.Runner() as runner:
+        runner.run(test_full_transfer_flow(config))
+        runner.run(test_authenticated_transfer(config))
+        runner.run(test_invalid_account_transfer(config))
+        runner.run(test_transfer_many(config))
+        runner.run(test_list_accounts(config))
 
     print("\n🎉 All integration tests passed!")
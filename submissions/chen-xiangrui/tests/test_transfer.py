@@ -5,14 +5,25 @@ Tests use pytest with mock responses to avoid external dependencies.
 """
 
 import asyncio
+import base64
+import copy
+import json
+import logging
+import pickle
+import time
+from datetime import datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
-from api_client import BankingAPIClient
+import api_client
+from api_client import BankingAPIClient, BankingAPIError, _backoff_delay
 from config import Config
-from models import TransferRequest, TransferResponse
+from models import AuthToken, TransferRequest, TransferResponse
 from services import TransferService
 
 
@@ -27,10 +38,108 @@ def config():
 
 
 @pytest.fixture
-def mock_session():
-    """Create a mock aiohttp session."""
-    session = MagicMock()
-    return session
+def token_cache(tmp_path, monkeypatch):
+    """Isolate the JWT cache in memory and on disk."""
+    monkeypatch.setattr(api_client, "TOKEN_CACHE_PATH", tmp_path / "jwt_cache")
+    monkeypatch.setattr(BankingAPIClient, "_token_cache", {})
+    return tmp_path / "jwt_cache"
+
+
+# Raw body of a request received by the banking_server fixture
+REQUEST_BODY = web.RequestKey("body", bytes)
+
+
+@pytest.fixture
+def banking_requests():
+    """Collect the requests received by the banking_server fixture."""
+    return []
+
+
+@pytest.fixture
+async def banking_server(banking_requests):
+    """
+    Serve stub banking endpoints from an in-process aiohttp server.
+
+    Account ACC9999 does not exist. Transfers to ACC9200 and ACC9300 answer
+    with plain text, with status 200 and 300 respectively. Bearer tokens
+    signed "revoked" are rejected with 401.
+    """
+
+    @web.middleware
+    async def record(request: web.Request, handler) -> web.StreamResponse:
+        request[REQUEST_BODY] = await request.read()
+        banking_requests.append(request)
+        if request.headers.get("Authorization", "").endswith(".revoked"):
+            return web.json_response({"error": "Unauthorized"}, status=401)
+        return await handler(request)
+
+    async def stream_json(request: web.Request, body: bytes) -> web.StreamResponse:
+        # Send the body in small chunks so clients have to parse it incrementally
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        for i in range(0, len(body), 16):
+            await response.write(body[i : i + 16])
+        await response.write_eof()
+        return response
+
+    async def validate_account(request: web.Request) -> web.Response:
+        account_number = request.match_info["account_number"]
+        if account_number == "ACC9999":
+            return web.json_response({"error": "Account not found"}, status=404)
+        return web.json_response({"isValid": True, "accountId": account_number, "status": "ACTIVE"})
+
+    async def account_balance(request: web.Request) -> web.Response:
+        account_number = request.match_info["account_number"]
+        if account_number == "ACC9999":
+            return web.json_response({"error": "Account not found"}, status=404)
+        return web.json_response({"accountNumber": account_number, "balance": 10.0})
+
+    async def list_accounts(request: web.Request) -> web.StreamResponse:
+        return await stream_json(
+            request,
+            b'{"accounts": [{"accountId": "ACC1000"}, {"accountId": "ACC1001"}],'
+            b' "totalAccounts": 2}',
+        )
+
+    async def transaction_history(request: web.Request) -> web.StreamResponse:
+        return await stream_json(
+            request,
+            b'{"transactions": [{"transactionId": "t1", "amount": 10.5}], "totalReturned": 1}',
+        )
+
+    async def transfer(request: web.Request) -> web.Response:
+        data = await request.json()
+        if data["toAccount"] == "ACC9200":
+            return web.Response(text="Transfer queued")
+        if data["toAccount"] == "ACC9300":
+            return web.Response(text="Multiple Choices", status=300)
+        return web.json_response(
+            {
+                "transactionId": "txn-123",
+                "status": "SUCCESS",
+                "timestamp": "2025-11-01T10:00:00Z",
+                **data,
+            }
+        )
+
+    app = web.Application(middlewares=[record])
+    app.router.add_get("/accounts", list_accounts)
+    app.router.add_get("/accounts/validate/{account_number}", validate_account)
+    app.router.add_get("/accounts/balance/{account_number}", account_balance)
+    app.router.add_get("/transactions/history", transaction_history)
+    app.router.add_post("/transfer", transfer)
+
+    async with TestServer(app) as server:
+        yield Config(base_url=str(server.make_url("")), timeout=10, max_retries=0)
+
+
+def make_jwt(exp: float, signature: str = "signature") -> str:
+    """Build an unsigned JWT carrying the given expiry."""
+
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'HS256'})}.{encode({'sub': 'alice', 'exp': exp})}.{signature}"
 
 
 class TestTransferRequest:
@@ -66,6 +175,15 @@ class TestTransferRequest:
                 amount=Decimal("100.00"),
             )
 
+    def test_blank_to_account(self):
+        """Test validation fails with a whitespace-only to_account."""
+        with pytest.raises(ValueError, match="Destination account cannot be empty"):
+            TransferRequest(
+                from_account="ACC1000",
+                to_account=" \t ",
+                amount=Decimal("100.00"),
+            )
+
     def test_same_accounts(self):
         """Test validation fails when from and to accounts are the same."""
         with pytest.raises(ValueError, match="Source and destination accounts must be different"):
@@ -107,6 +225,29 @@ class TestTransferRequest:
         assert result["toAccount"] == "ACC1001"
         assert result["amount"] == 100.00
 
+    def test_construct_skips_validation(self):
+        """Test construct() builds an equal request without validating."""
+        request = TransferRequest.construct("ACC1000", "ACC1001", Decimal("100.00"))
+
+        assert request == TransferRequest("ACC1000", "ACC1001", Decimal("100.00"))
+        assert request.to_json() == (
+            b'{"fromAccount":"ACC1000","toAccount":"ACC1001","amount":100.0}'
+        )
+        assert TransferRequest.construct("ACC1000", "ACC1000", Decimal("0")).amount == 0
+
+    def test_to_dict_returns_copy(self):
+        """Test mutating the returned dictionary does not affect the request."""
+        request = TransferRequest(
+            from_account="ACC1000",
+            to_account="ACC1001",
+            amount=Decimal("100.00"),
+        )
+
+        request.to_dict()["amount"] = 1.0
+
+        assert request.to_dict()["amount"] == 100.00
+        assert "_payload" not in repr(request)
+
 
 class TestTransferResponse:
     """Test TransferResponse model."""
@@ -131,95 +272,523 @@ class TestTransferResponse:
         assert response.to_account == "ACC1001"
         assert response.amount == Decimal("100.00")
         assert response.message == "Transfer completed"
+        assert response.new_from_balance is None
+        assert response.new_to_balance is None
 
+    def test_from_json(self):
+        """Test creating TransferResponse from raw response bytes."""
+        raw = b'{"transactionId": "txn-123", "status": "SUCCESS", "amount": 25.5}'
 
-class TestBankingAPIClient:
-    """Test BankingAPIClient."""
+        response = TransferResponse.from_json(raw)
 
-    @pytest.mark.asyncio
-    async def test_validate_account_success(self, config):
-        """Test account validation success."""
-        with patch("aiohttp.ClientSession") as mock_session_class:
-            # Setup mock
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.json = AsyncMock(return_value={"valid": True})
-            mock_response.text = AsyncMock(return_value='{"valid": true}')
+        assert response.transaction_id == "txn-123"
+        assert response.amount == Decimal("25.5")
 
-            mock_session = AsyncMock()
-            mock_session.request = AsyncMock(return_value=mock_response)
-            mock_session.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_session.__aexit__ = AsyncMock()
+    def test_from_dict_interns_repeated_strings(self):
+        """Test statuses and account numbers are shared between responses."""
+        first = TransferResponse.from_json(b'{"status": "SUCCESS", "fromAccount": "ACC1000"}')
+        second = TransferResponse.from_json(b'{"status": "SUCCESS", "fromAccount": "ACC1000"}')
 
-            mock_session_class.return_value = mock_session
+        assert first.status is second.status
+        assert first.from_account is second.from_account
 
-            # Test
-            async with BankingAPIClient(config) as client:
-                result = await client.validate_account("ACC1000")
+    def test_from_dict_timestamp_fallback(self):
+        """Test a missing timestamp falls back to a cached current ISO time."""
+        first = TransferResponse.from_dict({"transactionId": "txn-1"})
+        second = TransferResponse.from_dict({"transactionId": "txn-2", "issuedAt": "2025-11-01"})
 
-                assert result is True
+        assert abs(datetime.fromisoformat(first.timestamp) - datetime.now()).total_seconds() < 5
+        assert second.timestamp == "2025-11-01"
 
-    @pytest.mark.asyncio
-    async def test_validate_account_invalid(self, config):
-        """Test account validation for invalid account."""
-        with patch("aiohttp.ClientSession") as mock_session_class:
-            # Setup mock
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.json = AsyncMock(return_value={"valid": False})
-            mock_response.text = AsyncMock(return_value='{"valid": false}')
+    def test_from_dict_balances(self):
+        """Test float, string and int amounts are converted to exact Decimals."""
+        data = {"amount": 0.1, "newFromAccountBalance": "899.90", "newToAccountBalance": 1100}
+
+        response = TransferResponse.from_dict(data)
+
+        assert response.amount == Decimal("0.1")
+        assert response.new_from_balance == Decimal("899.90")
+        assert response.new_to_balance == Decimal("1100")
+
+
+class TestAuthToken:
+    """Test AuthToken model."""
+
+    def test_is_expired(self):
+        """Test expiry is checked against the precomputed epoch."""
+        past = AuthToken(token="t", expires_at=datetime.fromtimestamp(time.time() - 1))
+        future = AuthToken(token="t", expires_at=datetime.fromtimestamp(time.time() + 60))
+
+        assert past.is_expired()
+        assert not future.is_expired()
+        assert future.expires_epoch == pytest.approx(time.time() + 60, abs=1)
+
+    def test_no_expiry_never_expires(self):
+        """Test tokens without an expiry are never expired."""
+        token = AuthToken(token="t")
+
+        assert token.expires_epoch is None
+        assert not token.is_expired()
 
-            mock_session = AsyncMock()
-            mock_session.request = AsyncMock(return_value=mock_response)
-            mock_session.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_session.__aexit__ = AsyncMock()
 
-            mock_session_class.return_value = mock_session
+class TestBankingAPIClient:
+    """Test BankingAPIClient."""
 
-            # Test
-            async with BankingAPIClient(config) as client:
-                result = await client.validate_account("ACC9999")
+    @pytest.mark.asyncio
+    async def test_validate_account_success(self, banking_server):
+        """Test account validation success."""
+        async with BankingAPIClient(banking_server) as client:
+            result = await client.validate_account("ACC1000")
 
-                assert result is False
+            assert result is True
 
     @pytest.mark.asyncio
-    async def test_transfer_success(self, config):
+    async def test_validate_account_invalid(self, banking_server):
+        """Test account validation for invalid account."""
+        async with BankingAPIClient(banking_server) as client:
+            result = await client.validate_account("ACC9999")
+
+            assert result is False
+
+    @pytest.mark.asyncio
+    async def test_transfer_success(self, banking_server):
         """Test successful transfer."""
-        with patch("aiohttp.ClientSession") as mock_session_class:
-            # Setup mock
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.json = AsyncMock(
-                return_value={
-                    "transactionId": "txn-123",
-                    "status": "SUCCESS",
+        async with BankingAPIClient(banking_server) as client:
+            result = await client.transfer(
+                {
                     "fromAccount": "ACC1000",
                     "toAccount": "ACC1001",
                     "amount": 100.00,
-                    "timestamp": "2025-11-01T10:00:00Z",
                 }
             )
-            mock_response.text = AsyncMock(return_value='{"status": "SUCCESS"}')
 
-            mock_session = AsyncMock()
-            mock_session.request = AsyncMock(return_value=mock_response)
-            mock_session.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_session.__aexit__ = AsyncMock()
+            assert result["status"] == "SUCCESS"
+            assert result["transactionId"] == "txn-123"
+            assert result["amount"] == 100.00
+
+    @pytest.mark.asyncio
+    async def test_transfer_raw_sends_encoded_body(self, banking_server, banking_requests):
+        """Test transfer_raw posts the given bytes and returns the raw body."""
+        body = b'{"fromAccount":"ACC1000","toAccount":"ACC1001","amount":1.0}'
+
+        async with BankingAPIClient(banking_server) as client:
+            raw = await client.transfer_raw(body)
+
+        assert json.loads(raw)["transactionId"] == "txn-123"
+        assert banking_requests[-1][REQUEST_BODY] == body
+
+
+class TestTokenCache:
+    """Test JWT token caching in BankingAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_cached_token_reused(self, config, token_cache):
+        """Test a fresh token is served from cache without a second request."""
+        token = make_jwt(time.time() + 3600)
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock(return_value={"token": token})
+
+        assert await client.get_auth_token() == token
+        assert await client.get_auth_token() == token
+
+        client._make_request.assert_called_once()
+        assert token_cache.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_token_loaded_from_disk(self, config, token_cache):
+        """Test a token persisted by a previous process is reused."""
+        token = make_jwt(time.time() + 3600)
+        first = BankingAPIClient(config)
+        first._make_request = AsyncMock(return_value={"token": token})
+        await first.get_auth_token()
+
+        BankingAPIClient._token_cache.clear()
+        second = BankingAPIClient(config)
+        second._make_request = AsyncMock()
+
+        assert await second.get_auth_token() == token
+        second._make_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expiring_token_refreshed(self, config, token_cache):
+        """Test tokens inside the expiry buffer are re-requested."""
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock(
+            side_effect=[
+                {"token": make_jwt(time.time() + 10)},
+                {"token": make_jwt(time.time() + 3600)},
+            ]
+        )
+
+        await client.get_auth_token()
+        await client.get_auth_token()
+
+        assert client._make_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_token_not_shared_between_servers(self, config, token_cache):
+        """Test a token minted by one server is not reused for another."""
+        first = BankingAPIClient(config)
+        first._make_request = AsyncMock(return_value={"token": make_jwt(time.time() + 3600)})
+        await first.get_auth_token()
+
+        second = BankingAPIClient(Config(base_url="http://other-host:8123"))
+        second._make_request = AsyncMock(return_value={"token": make_jwt(time.time() + 3600)})
+        await second.get_auth_token()
+
+        second._make_request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_discarded(self, banking_server, token_cache):
+        """Test a 401 on an authenticated request drops the token from every cache."""
+        stale = make_jwt(time.time() + 3600, signature="revoked")
+        fresh = make_jwt(time.time() + 7200)
+
+        async with BankingAPIClient(banking_server) as client:
+            client._make_request = AsyncMock(return_value={"token": stale})
+            client.set_auth_token(await client.get_auth_token())
+
+            with pytest.raises(BankingAPIError):
+                await client._request_raw("GET", "/accounts")
+
+            assert client.auth_token is None
+            assert stale not in json.loads(token_cache.read_text()).values()
+
+            client._make_request = AsyncMock(return_value={"token": fresh})
+            assert await client.get_auth_token() == fresh
+
+
+class TestSharedSession:
+    """Test the process-wide aiohttp session shared between clients."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_session(self, config):
+        """Test nested clients reuse one session, closed by the last exit."""
+        async with BankingAPIClient(config) as first:
+            async with BankingAPIClient(config) as second:
+                assert first.session is second.session
+
+            session = first.session
+            assert not session.closed
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_new_session_after_close(self, config):
+        """Test a fresh session is created once the previous one was closed."""
+        async with BankingAPIClient(config) as client:
+            first_session = client.session
+
+        async with BankingAPIClient(config) as client:
+            assert client.session is not first_session
+            assert not client.session.closed
+
+    @pytest.mark.asyncio
+    async def test_use_after_close_raises(self, config):
+        """Test a closed client refuses requests instead of reacquiring the session."""
+        async with BankingAPIClient(config) as client:
+            pass
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await client._request_raw("GET", "/accounts")
+
+        assert client.session is None
+        assert api_client._SHARED_SESSION is None
+
+    @pytest.mark.asyncio
+    async def test_connector_uses_pool_config(self):
+        """Test the shared connector is sized from the configuration."""
+        config = Config(pool_size=7, pool_size_per_host=3)
+
+        async with BankingAPIClient(config) as client:
+            assert client.session.connector.limit == 7
+            assert client.session.connector.limit_per_host == 3
+
+
+class TestRetryBackoff:
+    """Test retry backoff in BankingAPIClient."""
+
+    def test_backoff_delay_is_capped(self):
+        """Test the delay never exceeds the cap, however many retries."""
+        for retry_count in range(20):
+            assert 0 <= _backoff_delay(retry_count, base=0.5, cap=30.0) <= 30.0
+
+    def test_backoff_delay_grows_exponentially(self):
+        """Test the jitter window doubles with each retry."""
+        with patch("api_client.random.uniform", side_effect=lambda low, high: high):
+            delays = [_backoff_delay(n, base=0.5, cap=30.0) for n in range(8)]
+
+        assert delays == [0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+
+    @pytest.mark.asyncio
+    async def test_retries_until_max_retries(self, config):
+        """Test connection failures are retried then raised as ConnectionError."""
+        async with BankingAPIClient(config) as client:
+            with (
+                patch.object(client, "session") as session,
+                patch("api_client.asyncio.sleep", new=AsyncMock()) as sleep,
+            ):
+                session.request.side_effect = aiohttp.ClientConnectionError("refused")
+
+                with pytest.raises(ConnectionError, match="Connection failed"):
+                    await client.validate_account("ACC1000")
+
+            assert session.request.call_count == config.max_retries + 1
+            assert sleep.await_count == config.max_retries
+
+
+class TestTokenValidation:
+    """Test JWT validation in BankingAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_valid_token_checked_offline(self, config):
+        """Test well-formed, unexpired tokens are accepted without a request."""
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock()
+
+        assert await client.validate_token(make_jwt(time.time() + 3600)) is True
+        client._make_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "token",
+        ["not-a-jwt", "a.b", "!!!.???.sig", "eyJhbGciOiJIUzI1NiJ9.WzFd.sig"],
+    )
+    async def test_malformed_token_rejected(self, config, token):
+        """Test malformed tokens are rejected without a request."""
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock()
+
+        assert await client.validate_token(token, online=True) is False
+        client._make_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_token_rejected(self, config):
+        """Test expired tokens are rejected without a request."""
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock()
+
+        assert await client.validate_token(make_jwt(time.time() - 1), online=True) is False
+        client._make_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_online_validation(self, config):
+        """Test online validation asks the server with the token under test."""
+        token = make_jwt(time.time() + 3600)
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock(return_value={"valid": False})
+
+        assert await client.validate_token(token, online=True) is False
+        headers = client._make_request.call_args.kwargs["headers"]
+        assert headers == {"Authorization": f"Bearer {token}"}
+
+
+class TestAuthHeaders:
+    """Test the prebuilt Authorization header in BankingAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_auth_header_sent(self, banking_server, banking_requests):
+        """Test requests carry the header built by set_auth_token."""
+        token = make_jwt(time.time() + 3600)
+
+        async with BankingAPIClient(banking_server) as client:
+            client.set_auth_token(token)
+            await client.get_account_balance("ACC1000")
+
+        assert banking_requests[-1].headers["Authorization"] == f"Bearer {token}"
+
+    @pytest.mark.asyncio
+    async def test_expired_auth_header_not_sent(self, banking_server, banking_requests):
+        """Test no Authorization header is sent once the token has expired."""
+        async with BankingAPIClient(banking_server) as client:
+            client.set_auth_token(make_jwt(time.time() - 10))
+            await client.get_account_balance("ACC1000")
+
+        assert "Authorization" not in banking_requests[-1].headers
+
+
+class TestURLs:
+    """Test URL construction in BankingAPIClient."""
+
+    def test_static_endpoint_cached(self, config):
+        """Test static endpoints are resolved once against the base URL."""
+        client = BankingAPIClient(config)
+
+        url = client._url("/transfer")
+
+        assert str(url) == "http://localhost:8123/transfer"
+        assert client._url("/transfer") is url
+
+    def test_base_url_path_kept(self):
+        """Test a base URL with a path prefix is preserved."""
+        client = BankingAPIClient(Config(base_url="http://example.com/api"))
+
+        assert str(client._url("/accounts")) == "http://example.com/api/accounts"
+        assert str(api_client._account_url(client._account_validate_url, "ACC1000")) == (
+            "http://example.com/api/accounts/validate/ACC1000"
+        )
+
+    @pytest.mark.parametrize(
+        "account_number, raw_path",
+        [
+            ("ACC1000", "/accounts/balance/ACC1000"),
+            ("ACC 1000?x=1", "/accounts/balance/ACC%201000%3Fx%3D1"),
+            ("a/b", "/accounts/balance/a%2Fb"),
+            ("../x", "/accounts/balance/..%2Fx"),
+            ("..", "/accounts/balance/%2E%2E"),
+        ],
+    )
+    def test_account_number_quoted(self, config, account_number, raw_path):
+        """Test account numbers cannot escape their path segment."""
+        client = BankingAPIClient(config)
+
+        url = api_client._account_url(client._account_balance_url, account_number)
+
+        assert url.raw_path == raw_path
+        assert url.query_string == ""
+
+
+class TestResponseParsing:
+    """Test response body handling in BankingAPIClient._make_request."""
+
+    @pytest.mark.asyncio
+    async def test_json_body_parsed(self, banking_server):
+        """Test JSON bodies are parsed from the raw response bytes."""
+        async with BankingAPIClient(banking_server) as client:
+            result = await client._make_request("GET", "/accounts/validate/ACC1000")
+
+        assert result == {"isValid": True, "accountId": "ACC1000", "status": "ACTIVE"}
+
+    @pytest.mark.asyncio
+    async def test_non_json_success_body(self, banking_server):
+        """Test non-JSON success bodies are wrapped in a status message."""
+        async with BankingAPIClient(banking_server) as client:
+            result = await client._make_request(
+                "POST", "/transfer", json_data={"toAccount": "ACC9200"}
+            )
+
+        assert result == {"status": "success", "message": "Transfer queued"}
+
+    @pytest.mark.asyncio
+    async def test_non_json_redirect_raises(self, banking_server):
+        """Test non-JSON bodies outside 2xx raise and keep the raw body."""
+        async with BankingAPIClient(banking_server) as client:
+            with pytest.raises(BankingAPIError, match="Invalid JSON") as exc_info:
+                await client._make_request("POST", "/transfer", json_data={"toAccount": "ACC9300"})
+
+        assert exc_info.value.body == b"Multiple Choices"
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, banking_server):
+        """Test 4xx responses raise BankingAPIError with the status code."""
+        async with BankingAPIClient(banking_server) as client:
+            with pytest.raises(BankingAPIError, match="Account not found") as exc_info:
+                await client._make_request("GET", "/accounts/balance/ACC9999")
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_logged_as_error(self, banking_server, caplog):
+        """Test expected 4xx responses are not logged at ERROR level."""
+        async with BankingAPIClient(banking_server) as client:
+            assert await client.validate_account("ACC9999") is False
+
+        assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+
+    def test_error_message_built_lazily(self):
+        """Test error messages are formatted from a truncated body on demand."""
+        error = BankingAPIError(status_code=500, body=b"x" * 1000)
+
+        assert error._message is None
+        assert str(error) == f"API error (status 500): {'x' * 200}"
+        assert BankingAPIError("Custom failure").message == "Custom failure"
+
+    def test_error_survives_pickle_and_copy(self):
+        """Test errors keep their message, status and body when pickled or copied."""
+        error = BankingAPIError(status_code=404, body=b'{"error": "Account not found"}')
+
+        assert error.args == (None, 404, b'{"error": "Account not found"}')
+        for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+            assert type(clone) is BankingAPIError
+            assert clone.status_code == 404
+            assert clone.body == error.body
+            assert str(clone) == str(error)
+
+
+class TestStreaming:
+    """Test streamed list endpoints in BankingAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_iter_accounts(self, banking_server):
+        """Test accounts are yielded one by one from the response stream."""
+        async with BankingAPIClient(banking_server) as client:
+            accounts = [account async for account in client.iter_accounts()]
+
+        assert accounts == [{"accountId": "ACC1000"}, {"accountId": "ACC1001"}]
+
+    @pytest.mark.asyncio
+    async def test_transaction_history(self, banking_server, banking_requests):
+        """Test history is collected from the stream with float amounts."""
+        async with BankingAPIClient(banking_server) as client:
+            history = await client.get_transaction_history("ACC1000", limit=5)
+
+        assert history == [{"transactionId": "t1", "amount": 10.5}]
+        assert banking_requests[-1].query == {"limit": "5", "accountNumber": "ACC1000"}
+
+    @pytest.mark.asyncio
+    async def test_stream_error_status_raises(self, banking_server):
+        """Test error statuses raise before anything is streamed."""
+        async with BankingAPIClient(banking_server) as client:
+            client.set_auth_token(make_jwt(time.time() + 3600, signature="revoked"))
+
+            with pytest.raises(BankingAPIError) as exc_info:
+                await client.list_accounts()
+
+        assert exc_info.value.status_code == 401
+
+
+class TestValidationCache:
+    """Test account validation caching in BankingAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_validation_cached(self, config):
+        """Test repeated validations of an account hit the server once."""
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock(return_value={"isValid": True, "status": "ACTIVE"})
+
+        assert await client.validate_account("ACC1000") is True
+        assert await client.validate_account("ACC1000") is True
+
+        client._make_request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_validation_cache_expires(self, config):
+        """Test cached validations are refreshed after the TTL."""
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock(return_value={"isValid": True})
+
+        with patch("api_client.time.monotonic", return_value=1000.0):
+            await client.validate_account("ACC1000")
+        with patch("api_client.time.monotonic", return_value=1000.0 + 61):
+            await client.validate_account("ACC1000")
+
+        assert client._make_request.call_count == 2
 
-            mock_session_class.return_value = mock_session
+    @pytest.mark.asyncio
+    async def test_validate_accounts_bulk(self, config):
+        """Test bulk validation only requests uncached accounts, once each."""
+        client = BankingAPIClient(config)
+        client._make_request = AsyncMock(
+            side_effect=lambda method, endpoint: {"isValid": endpoint.name != "ACC9999"}
+        )
+        await client.validate_account("ACC1001")
+        client._make_request.reset_mock()
 
-            # Test
-            async with BankingAPIClient(config) as client:
-                result = await client.transfer(
-                    {
-                        "fromAccount": "ACC1000",
-                        "toAccount": "ACC1001",
-                        "amount": 100.00,
-                    }
-                )
+        result = await client.validate_accounts(["ACC1000", "ACC1001", "ACC9999", "ACC1000"])
 
-                assert result["status"] == "SUCCESS"
-                assert result["transactionId"] == "txn-123"
+        assert result == {"ACC1000": True, "ACC1001": True, "ACC9999": False}
+        assert list(result) == ["ACC1000", "ACC1001", "ACC9999"]
+        assert client._make_request.call_count == 2
 
 
 class TestTransferService:
@@ -230,15 +799,17 @@ class TestTransferService:
         """Test successful transfer through service."""
         # Create mock API client
         mock_client = AsyncMock(spec=BankingAPIClient)
-        mock_client.transfer = AsyncMock(
-            return_value={
-                "transactionId": "txn-123",
-                "status": "SUCCESS",
-                "fromAccount": "ACC1000",
-                "toAccount": "ACC1001",
-                "amount": 100.00,
-                "timestamp": "2025-11-01T10:00:00Z",
-            }
+        mock_client.transfer_raw = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "transactionId": "txn-123",
+                    "status": "SUCCESS",
+                    "fromAccount": "ACC1000",
+                    "toAccount": "ACC1001",
+                    "amount": 100.00,
+                    "timestamp": "2025-11-01T10:00:00Z",
+                }
+            ).encode()
         )
 
         # Test service
@@ -254,7 +825,128 @@ class TestTransferService:
 
         assert response.status == "SUCCESS"
         assert response.transaction_id == "txn-123"
-        mock_client.transfer.assert_called_once()
+        assert response.amount == Decimal("100.0")
+        mock_client.transfer_raw.assert_called_once_with(
+            b'{"fromAccount":"ACC1000","toAccount":"ACC1001","amount":100.0}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_transfer_plain_text_response(self):
+        """Test a plain-text success body becomes a successful response."""
+        mock_client = AsyncMock(spec=BankingAPIClient)
+        mock_client.transfer_raw.return_value = b"Transfer queued"
+
+        service = TransferService(mock_client)
+        request = TransferRequest(from_account="ACC1000", to_account="ACC1001", amount=Decimal(1))
+
+        response = await service.transfer(request)
+
+        assert response.status == "success"
+        assert response.message == "Transfer queued"
+
+    @pytest.mark.asyncio
+    async def test_transfer_non_2xx_plain_text_raises(self, banking_server):
+        """Test a non-JSON body outside 2xx fails the transfer instead of succeeding."""
+        request = TransferRequest(from_account="ACC1000", to_account="ACC9300", amount=Decimal(1))
+
+        async with BankingAPIClient(banking_server) as client:
+            with pytest.raises(BankingAPIError) as exc_info:
+                await TransferService(client).transfer(request)
+
+        assert exc_info.value.status_code == 300
+        assert exc_info.value.body == b"Multiple Choices"
+
+    @pytest.mark.asyncio
+    async def test_validate_accounts_in_input_order(self):
+        """Test batch validation maps client results back to the input order."""
+        mock_client = AsyncMock(spec=BankingAPIClient)
+        mock_client.validate_accounts.return_value = {"ACC1001": True, "ACC9999": False}
+
+        service = TransferService(mock_client)
+
+        assert await service.validate_accounts(["ACC9999", "ACC1001"]) == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_transfer_many_limits_concurrency(self, config):
+        """Test transfers run concurrently up to the limit, failures returned in place."""
+        in_flight = peak = 0
+
+        async def transfer_raw(body):
+            nonlocal in_flight, peak
+            payload = json.loads(body)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if payload["toAccount"] == "ACC9999":
+                raise BankingAPIError("Account not found", status_code=404)
+            return json.dumps({"transactionId": payload["toAccount"], "status": "SUCCESS"}).encode()
+
+        mock_client = AsyncMock(spec=BankingAPIClient)
+        mock_client.transfer_raw.side_effect = transfer_raw
+        service = TransferService(mock_client)
+
+        requests = [
+            TransferRequest(from_account="ACC1000", to_account=to, amount=Decimal("1.00"))
+            for to in ("ACC1001", "ACC9999", "ACC1002")
+        ]
+        results = await service.transfer_many(requests, concurrency=2)
+
+        assert peak == 2
+        assert results[0].transaction_id == "ACC1001"
+        assert isinstance(results[1], BankingAPIError)
+        assert results[2].transaction_id == "ACC1002"
+
+    @pytest.mark.asyncio
+    async def test_transfer_many_unlimited_pool(self):
+        """Test a pool limit of 0 (unlimited in aiohttp) does not block the batch."""
+        mock_client = AsyncMock(spec=BankingAPIClient)
+        mock_client.config = Config(pool_size=0, pool_size_per_host=0)
+        mock_client.transfer_raw.return_value = b'{"transactionId": "txn-1"}'
+        service = TransferService(mock_client)
+
+        request = TransferRequest(from_account="ACC1000", to_account="ACC1001", amount=Decimal(1))
+        results = await asyncio.wait_for(service.transfer_many([request, request]), timeout=1)
+
+        assert [result.transaction_id for result in results] == ["txn-1", "txn-1"]
+
+    @pytest.mark.asyncio
+    async def test_transfer_many_rejects_zero_concurrency(self):
+        """Test a concurrency below 1 is rejected instead of hanging."""
+        service = TransferService(AsyncMock(spec=BankingAPIClient))
+
+        with pytest.raises(ValueError, match="at least 1"):
+            await service.transfer_many([], concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_own_client_reuses_one_session(self, banking_server, banking_requests):
+        """Test a service without a client connects once and releases on close."""
+        with (
+            patch(
+                "api_client._get_or_create_shared_session",
+                new=AsyncMock(wraps=api_client._get_or_create_shared_session),
+            ) as acquire,
+            patch(
+                "api_client._release_shared_session",
+                new=AsyncMock(wraps=api_client._release_shared_session),
+            ) as release,
+        ):
+            async with TransferService(config=banking_server) as service:
+                await service.get_balance("ACC1000")
+                await service.get_balance("ACC1001")
+                session = service.api_client.session
+
+        acquire.assert_awaited_once()
+        release.assert_awaited_once_with(session)
+        assert len(banking_requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_borrowed_client_left_open(self, config):
+        """Test closing a service does not close a client it was given."""
+        async with BankingAPIClient(config) as client:
+            await TransferService(client).close()
+
+            assert client.session is not None
 
 
 class TestConfig:
@@ -293,3 +985,64 @@ class TestConfig:
 
             assert config.base_url == "http://test.com:8080"
             assert config.timeout == 45
+
+    def test_pool_config_from_env(self):
+        """Test loading connection pool settings from environment variables."""
+        with patch.dict(
+            "os.environ",
+            {
+                "BANKING_API_POOL_SIZE": "64",
+                "BANKING_API_POOL_SIZE_PER_HOST": "8",
+                "BANKING_API_KEEPALIVE_TIMEOUT": "invalid",
+            },
+        ):
+            config = Config.load()
+
+            assert config.pool_size == 64
+            assert config.pool_size_per_host == 8
+            assert config.keepalive_timeout == 75
+
+    def test_load_reads_file_once(self, tmp_path):
+        """Test repeated loads of the same file reuse the parsed data."""
+        config_file = tmp_path / "settings.json"
+        config_file.write_text('{"base_url": "http://file.example:9000", "timeout": 12}')
+
+        with patch.object(Config, "_load_from_file", wraps=Config._load_from_file) as load:
+            first = Config.load(str(config_file))
+            second = Config.load(str(config_file))
+
+        assert load.call_count == 1
+        assert first == second
+        assert first is not second
+        assert first.base_url == "http://file.example:9000"
+
+    def test_reload_picks_up_file_changes(self, tmp_path):
+        """Test reload() re-reads a file that load() had cached."""
+        config_file = tmp_path / "settings.json"
+        config_file.write_text('{"timeout": 12}')
+        Config.load(str(config_file))
+
+        config_file.write_text('{"timeout": 24}')
+
+        assert Config.load(str(config_file)).timeout == 12
+        assert Config.reload(str(config_file)).timeout == 24
+
+    def test_load_missing_default_file(self, tmp_path, monkeypatch):
+        """Test a missing default config file falls back to built-in defaults."""
+        monkeypatch.setattr("config._DEFAULT_CONFIG_PATH", tmp_path / "absent.json")
+
+        config = Config.reload()
+
+        assert config.timeout == 30
+        Config._load_cached.cache_clear()
+
+    def test_load_tracks_env_changes(self, tmp_path):
+        """Test memoized loads still pick up changed environment variables."""
+        config_file = tmp_path / "settings.json"
+        config_file.write_text('{"timeout": 12}')
+
+        with patch.dict("os.environ", {"BANKING_API_TIMEOUT": "20"}):
+            assert Config.load(str(config_file)).timeout == 20
+
+        with patch.dict("os.environ", {"BANKING_API_TIMEOUT": "40"}):
+            assert Config.load(str(config_file)).timeout == 40